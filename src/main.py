@@ -9,20 +9,56 @@ import sys
 import re
 import ssl
 import time
+import sqlite3
 import argparse
-from collections import defaultdict
+import asyncio
+import inspect
+import io
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import feedparser
+import aiohttp
+from lxml import etree
+import lxml.html
 import requests
 import anthropic
 import trafilatura
 from datetime import datetime, timedelta
+from email.utils import parsedate_tz
 from zoneinfo import ZoneInfo
+from dateutil import parser as dateutil_parser
+from dateutil.tz import tzoffset
 from dotenv import load_dotenv
 
 # Timezone
 UTC = ZoneInfo("UTC")
 
+# Today's date in UTC, refreshed once at the start of main()
+TODAY_UTC = datetime.now(UTC).date()
+
+# Zone abbreviations for RFC 822 dates and the dateutil fallback, which can't resolve them on its own
+TZMAP = {
+    'UT': tzoffset(None, 0), 'GMT': tzoffset(None, 0), 'UTC': tzoffset(None, 0), 'Z': tzoffset(None, 0),
+    'AST': tzoffset(None, -4 * 3600), 'ADT': tzoffset(None, -3 * 3600),
+    'EST': tzoffset(None, -5 * 3600), 'EDT': tzoffset(None, -4 * 3600),
+    'CST': tzoffset(None, -6 * 3600), 'CDT': tzoffset(None, -5 * 3600),
+    'MST': tzoffset(None, -7 * 3600), 'MDT': tzoffset(None, -6 * 3600),
+    'PST': tzoffset(None, -8 * 3600), 'PDT': tzoffset(None, -7 * 3600),
+    'BST': tzoffset(None, 1 * 3600), 'CET': tzoffset(None, 1 * 3600), 'CEST': tzoffset(None, 2 * 3600),
+}
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+ISO_DATE_RE = re.compile(r'^\d{4}-')
+
+# Precompiled patterns for clean_html
+TAG_RE = re.compile(r'<[^>]+>')
+# A real start/end tag, so a bare '<' in plain text (e.g. LaTeX "$k<n$") isn't taken for markup
+HTML_TAG_RE = re.compile(r'</?[a-zA-Z][a-zA-Z0-9]*(?:\s[^<>]*)?/?>')
+WS_RE = re.compile(r'\s+')
+
+# One numbered line of Claude's response: "1. summary", "1) summary" or "1 summary"
+SUMMARY_LINE_RE = re.compile(r'(?m)^[ \t]*(\d+)[.) \t]+(\S.*?)[ \t\r]*$')
+
 # Load environment variables
 load_dotenv()
 CLAUDE_API_KEY = os.getenv("CLAUDE_API_KEY")
@@ -33,21 +69,124 @@ if not CLAUDE_API_KEY:
     print("   CLAUDE_API_KEY=sk-ant-api03-YOUR_KEY_HERE")
     sys.exit(1)
 
-client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
-
-
-def clean_html(text: str) -> str:
-    """Remove HTML tags and clean up text."""
+client = anthropic.AsyncAnthropic(api_key=CLAUDE_API_KEY)
+
+# Cap concurrent Claude requests to stay under the per-minute rate limit
+SUMMARY_CONCURRENCY = 5
+SUMMARY_MAX_RETRIES = 5
+SUMMARY_UNAVAILABLE = "Summary unavailable"
+SUMMARY_ERROR = "Error generating summary"
+summary_semaphore = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+
+# Network settings for the concurrent fetch phase
+FETCH_CONCURRENCY = 32
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30)
+MAX_CONNECTIONS = 64
+MAX_CONNECTIONS_PER_HOST = 8
+SSL_CONTEXT = ssl.create_default_context()
+
+# Keep-alive session for fetchers called outside the async pipeline
+http_session = requests.Session()
+http_session.headers['User-Agent'] = feedparser.USER_AGENT
+
+# clean_html strips tags afterwards, so skip feedparser's sanitizer and URI resolution passes,
+# both globally and per call. Older releases also parse microformats unless told not to.
+feedparser.SANITIZE_HTML = 0
+feedparser.RESOLVE_RELATIVE_URIS = 0
+if hasattr(feedparser, 'PARSE_MICROFORMATS'):
+    feedparser.PARSE_MICROFORMATS = 0
+
+# Newer feedparser releases can also detect encoding without holding extra copies of the feed.
+FEEDPARSER_OPTIONS = {'sanitize_html': False, 'resolve_relative_uris': False}
+if 'optimistic_encoding_detection' in inspect.signature(feedparser.parse).parameters:
+    FEEDPARSER_OPTIONS['optimistic_encoding_detection'] = True
+
+# Columns read from feeds.csv, in the order of the Feed tuple built from each row
+FEED_COLUMNS = ['Category', 'Source Name', 'URL', 'Type']
+Feed = namedtuple('Feed', ['category', 'source_name', 'url', 'type'])
+
+# Columns of the articles DataFrame built by the fetch phase
+ARTICLE_COLUMNS = ['category', 'source', 'title', 'link', 'raw_content', 'pub_date', 'guid']
+
+# XML namespaces used by the lxml fast path
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+ITUNES_NS = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
+XHTML_NS = '{http://www.w3.org/1999/xhtml}'
+CONTENT_NS = '{http://purl.org/rss/1.0/modules/content/}'
+
+# Elements that end a line of text in Atom type="xhtml" content, with or without the namespace
+XHTML_BLOCK_TAGS = tuple(prefix + tag for prefix in (XHTML_NS, '') for tag in (
+    'p', 'div', 'br', 'li', 'tr', 'td', 'th', 'blockquote', 'pre', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# Root tags sniffed from the start of a download; the lookahead skips prefixed tags like <feedburner:info>
+FEED_ROOT_RE = re.compile(rb'<(rss|feed|rdf:RDF)(?=[\s>])')
+FEED_ROOT_KINDS = {b'rss': 'rss', b'feed': 'atom', b'rdf:RDF': 'rdf'}
+
+# Elements the fast path streams for each sniffed feed kind. RSS 1.0 (rdf) items are
+# namespaced throughout, so those feeds go straight to feedparser.
+FAST_PATH_TAGS = {'rss': ('item',), 'atom': (ATOM_NS + 'entry',)}
+
+
+def clean_html(text: str, plain: bool = False) -> str:
+    """Remove HTML tags and clean up text.
+
+    Content declared as plain text is never parsed as HTML; only stray tags are stripped from it.
+    """
     if not text:
         return ""
-    text = re.sub(r'<[^>]+>', '', text)
-    text = text.replace('\n', ' ').replace('\r', ' ')
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    if plain:
+        text = HTML_TAG_RE.sub('', text)
+    # Summaries without markup skip building an lxml tree
+    elif HTML_TAG_RE.search(text):
+        try:
+            doc = lxml.html.fromstring(text)
+            etree.strip_elements(doc, 'script', 'style', with_tail=False)
+            text = doc.text_content()
+        except (etree.ParserError, ValueError):
+            text = TAG_RE.sub('', text)
+    return WS_RE.sub(' ', text).strip()
+
+
+def parse_date_string(text: str) -> datetime | None:
+    """Parse an RSS (RFC 822) or Atom (RFC 3339) date string into a UTC-aware datetime."""
+    try:
+        if text.startswith(WEEKDAYS):
+            fields = parsedate_tz(text)
+            if fields is None:
+                raise ValueError(text)
+            # email.utils reads zones it doesn't know (CEST, BST, ...) as UTC, so names go through TZMAP
+            zone = text.rsplit(None, 1)[-1]
+            if zone.isalpha():
+                tz = TZMAP.get(zone.upper())
+                if tz is None:
+                    raise ValueError(text)
+            else:
+                tz = tzoffset(None, fields[9])
+            parsed = datetime(*fields[:6], tzinfo=tz)
+        elif ISO_DATE_RE.match(text):
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        else:
+            raise ValueError(text)
+    except (ValueError, TypeError):
+        # Non-standard formats go through dateutil
+        try:
+            parsed = dateutil_parser.parse(text, tzinfos=TZMAP)
+        except (ValueError, OverflowError):
+            return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
 
 
 def parse_pub_date(entry) -> datetime | None:
     """Extract publication date from a feed entry and return as UTC-aware datetime."""
+    # Entries from the lxml fast path carry an already-parsed UTC date
+    pub_date = entry.get('pub_date')
+    if pub_date:
+        return pub_date
+
     # Try different date fields
     for field in ['published_parsed', 'updated_parsed', 'created_parsed']:
         parsed = getattr(entry, field, None)
@@ -60,65 +199,293 @@ def parse_pub_date(entry) -> datetime | None:
     return None
 
 
+def is_plain_text(entry) -> bool:
+    """Check whether an entry's summary is declared as plain text (e.g. Atom type="text")."""
+    return entry.get('summary_detail', {}).get('type') == 'text/plain'
+
+
+def entry_guid(url: str, entry) -> str | None:
+    """Return the summary-cache key for an entry: its id (or link) scoped to the feed URL.
+
+    Non-URL guids (numbers, slugs) are only unique within one feed.
+    """
+    guid = getattr(entry, 'id', None) or getattr(entry, 'link', None)
+    return f"{url} {guid}" if guid else None
+
+
 def is_today(pub_date: datetime | None) -> bool:
     """Check if a publication date is from today (UTC midnight-to-midnight)."""
     if not pub_date:
         return False
-    today_utc = datetime.now(UTC).date()
-    # Ensure we're comparing in UTC
-    if pub_date.tzinfo is None:
-        pub_date = pub_date.replace(tzinfo=UTC)
-    return pub_date.astimezone(UTC).date() == today_utc
+    # Parsed dates are already UTC (naive ones are treated as UTC), so skip the conversion
+    if pub_date.tzinfo is UTC or pub_date.tzinfo is None:
+        return pub_date.date() == TODAY_UTC
+    return pub_date.astimezone(UTC).date() == TODAY_UTC
 
 
-def format_pub_date(pub_date: datetime | None) -> str:
-    """Format publication date as MM-DD-YYYY / HH:MM UTC."""
-    if not pub_date:
-        return "N/A"
-    try:
-        if pub_date.tzinfo is None:
-            pub_date = pub_date.replace(tzinfo=UTC)
-        pub_utc = pub_date.astimezone(UTC)
-        return pub_utc.strftime("%m-%d-%Y / %H:%M UTC")
-    except:
-        return pub_date.strftime("%m-%d-%Y / %H:%M")
+def today_start_utc() -> datetime:
+    """Return midnight UTC at the start of today."""
+    return datetime.combine(TODAY_UTC, datetime.min.time(), tzinfo=UTC)
+
+
+def is_newest_first(entries: list) -> bool:
+    """Check whether a feed lists entries newest-first, judged by its first two entries."""
+    if len(entries) < 2:
+        return False
+    first, second = parse_pub_date(entries[0]), parse_pub_date(entries[1])
+    return first is not None and second is not None and first >= second
+
+
+def format_pub_dates(pub_dates: pd.Series) -> pd.Series:
+    """Format UTC publication dates as MM-DD-YYYY / HH:MM UTC, N/A where missing."""
+    return pub_dates.dt.strftime("%m-%d-%Y / %H:%M UTC").fillna("N/A")
+
+
+class FeedCache:
+    """Stores each feed's ETag / Last-Modified validators and raw response body in sqlite.
+
+    Bodies are kept unparsed so a 304 re-runs the current parsing code on them.
+    """
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        # Earlier versions stored pickled entries in a "feeds" table
+        self.conn.execute("DROP TABLE IF EXISTS feeds")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content BLOB)"
+        )
+
+    def get(self, url: str) -> tuple:
+        """Return (etag, last_modified, cached_content) for a URL, or Nones if not cached."""
+        row = self.conn.execute(
+            "SELECT etag, last_modified, content FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if not row:
+            return None, None, None
+        return row
+
+    def set(self, url: str, etag: str | None, last_modified: str | None, content: bytes):
+        """Overwrite the cached validators and response body for a URL."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (url, etag, last_modified, content) VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, content)
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
 
 
-def fetch_feed_content(url: str) -> feedparser.FeedParserDict:
-    """Fetch and parse a feed, handling SSL certificate issues."""
-    # First try direct parsing
-    feed = feedparser.parse(url)
+class SummaryCache:
+    """Stores Claude summaries in sqlite, keyed by feed URL + entry GUID, so re-runs skip known articles."""
 
-    # If SSL error, retry with requests (which can skip verification)
-    if feed.bozo and 'CERTIFICATE_VERIFY_FAILED' in str(feed.bozo_exception):
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries "
+            "(guid TEXT PRIMARY KEY, summary TEXT, ts INTEGER)"
+        )
+
+    def get_many(self, guids: list) -> dict:
+        """Return {guid: summary} for the GUIDs that have a cached summary."""
+        summaries = {}
+        # Stay under sqlite's bound-parameter limit
+        for i in range(0, len(guids), 500):
+            chunk = guids[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            summaries.update(self.conn.execute(
+                f"SELECT guid, summary FROM summaries WHERE guid IN ({placeholders})", chunk
+            ).fetchall())
+        return summaries
+
+    def set_many(self, items: list):
+        """Store (guid, summary) pairs, replacing any existing entries."""
+        now = int(time.time())
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO summaries (guid, summary, ts) VALUES (?, ?, ?)",
+            [(guid, summary, now) for guid, summary in items]
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def parse_feed(source) -> feedparser.FeedParserDict:
+    """Parse feed bytes or a file-like object with the fast feedparser options."""
+    return feedparser.parse(source, **FEEDPARSER_OPTIONS)
+
+
+def _text(elem, path: str) -> str | None:
+    """Return the stripped text at path under elem, or None if missing/empty."""
+    text = elem.findtext(path)
+    return text.strip() if text and text.strip() else None
+
+
+def _xhtml_text(elem) -> str:
+    """Return the text of an xhtml construct, keeping block elements apart with a space."""
+    for block in elem.iter(*XHTML_BLOCK_TAGS):
+        block.tail = ' ' + (block.tail or '')
+    return WS_RE.sub(' ', ''.join(elem.itertext()))
+
+
+def _atom_text(elem, path: str) -> str | None:
+    """Like _text, but reads type="xhtml" constructs, whose text sits inside a child <div>."""
+    child = elem.find(path)
+    if child is None:
+        return None
+    text = _xhtml_text(child) if child.get('type') == 'xhtml' else child.text
+    return text.strip() if text and text.strip() else None
+
+
+def _atom_summary(elem) -> tuple:
+    """Return (text, content type) of an Atom entry's summary, or of its content if it has none."""
+    for path in (ATOM_NS + 'summary', ATOM_NS + 'content'):
+        text = _atom_text(elem, path)
+        if text:
+            # Atom constructs default to type="text"; xhtml has already been reduced to text
+            kind = elem.find(path).get('type', 'text')
+            return text, 'text/plain' if kind in ('text', 'xhtml') else 'text/html'
+    return None, None
+
+
+def _rss_link(elem) -> str | None:
+    """Return an RSS item's <link>, falling back to a permalink <guid> like feedparser does."""
+    link = _text(elem, 'link')
+    if link:
+        return link
+    guid = elem.find('guid')
+    if guid is not None and guid.get('isPermaLink', 'true') != 'false':
+        return _text(elem, 'guid')
+    return None
+
+
+def _atom_link(elem) -> str | None:
+    """Return the alternate link of an Atom entry; a link without rel counts as alternate."""
+    fallback = None
+    for link in elem.iterfind(ATOM_NS + 'link'):
+        if link.get('rel', 'alternate') == 'alternate':
+            return link.get('href')
+        if fallback is None:
+            fallback = link.get('href')
+    return fallback
+
+
+def sniff_feed_type(content: bytes) -> str:
+    """Guess 'atom', 'rss', 'rdf' or 'html' from the root tag in the first bytes of a download."""
+    match = FEED_ROOT_RE.search(content, 0, 512)
+    if not match:
+        return 'html'
+    return FEED_ROOT_KINDS[match.group(1)]
+
+
+def fetch_rss_fast(content: bytes, max_items: int | None = None, tags: tuple = ('item', ATOM_NS + 'entry')) -> list:
+    """Stream <item>/<entry> elements with lxml instead of building a full feedparser tree.
+
+    Returns feedparser-style entries (title, link, summary, published, id, and authors and summary_detail for Atom)
+    plus a parsed UTC pub_date.
+    Raises etree.XMLSyntaxError on malformed feeds so callers can fall back to feedparser.
+    """
+    entries = []
+    for _, elem in etree.iterparse(io.BytesIO(content), events=('end',), tag=tags):
+        if elem.tag == 'item':
+            fields = {
+                'title': _text(elem, 'title'),
+                'link': _rss_link(elem),
+                'summary': (_text(elem, 'description') or _text(elem, CONTENT_NS + 'encoded')
+                            or _text(elem, ITUNES_NS + 'summary')),
+                'published': _text(elem, 'pubDate') or _text(elem, DC_NS + 'date'),
+                'id': _text(elem, 'guid'),
+            }
+        else:
+            summary, summary_type = _atom_summary(elem)
+            fields = {
+                'title': _atom_text(elem, ATOM_NS + 'title'),
+                'link': _atom_link(elem),
+                'summary': summary,
+                'summary_detail': feedparser.FeedParserDict(type=summary_type) if summary_type else None,
+                'published': _text(elem, ATOM_NS + 'published') or _text(elem, ATOM_NS + 'updated'),
+                'id': _text(elem, ATOM_NS + 'id'),
+                'authors': [{'name': name} for name in
+                            (_text(author, ATOM_NS + 'name') for author in elem.iterfind(ATOM_NS + 'author'))
+                            if name] or None,
+            }
+
+        entry = feedparser.FeedParserDict({k: v for k, v in fields.items() if v is not None})
+        if 'published' in entry:
+            entry['pub_date'] = parse_date_string(entry['published'])
+        entries.append(entry)
+
+        # Free the parsed element and any siblings already processed
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+        if max_items is not None and len(entries) >= max_items:
+            break
+
+    return entries
+
+
+def load_feed(content: bytes, max_items: int | None = None) -> feedparser.FeedParserDict:
+    """Parse downloaded feed bytes, sniffing RSS/Atom to use the lxml fast path.
+
+    Anything that doesn't look like a feed, or that the fast path can't read, goes to feedparser.
+    """
+    feed_kind = sniff_feed_type(content)
+    if feed_kind in FAST_PATH_TAGS:
         try:
-            response = requests.get(url, verify=False, timeout=30)
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
-        except requests.RequestException as e:
-            # Return the original failed feed
+            entries = fetch_rss_fast(content, max_items, FAST_PATH_TAGS[feed_kind])
+            if entries:
+                return feedparser.FeedParserDict(entries=entries, bozo=False)
+        except etree.XMLSyntaxError:
             pass
+    return parse_feed(content)
 
-    return feed
 
+def fetch_feed_content(url: str, content: bytes | None = None,
+                       max_items: int | None = None) -> feedparser.FeedParserDict:
+    """Fetch and parse a feed, handling SSL certificate issues.
+
+    If content is given (already downloaded), parse it directly and skip the fetch.
+    """
+    if content is None:
+        # Download through the shared session so connections are reused
+        try:
+            response = http_session.get(url, timeout=30)
+        except requests.exceptions.SSLError:
+            # Retry without certificate verification
+            response = http_session.get(url, verify=False, timeout=30)
+        response.raise_for_status()
+        content = response.content
 
-def fetch_rss(url: str, category: str, source_name: str, max_items: int = 50, fetch_all: bool = False) -> list:
+    return load_feed(content, max_items)
+
+
+def fetch_rss(url: str, category: str, source_name: str, max_items: int = 50, fetch_all: bool = False,
+              content: bytes | None = None) -> list:
     """Fetch standard RSS/Atom feeds. Returns list of article dicts."""
     try:
-        feed = fetch_feed_content(url)
+        feed = fetch_feed_content(url, content, None if fetch_all else max_items)
         if feed.bozo and not feed.entries:
             return []
 
         articles = []
         entries = feed.entries if fetch_all else feed.entries[:max_items]
+        today_start = today_start_utc()
+        newest_first = not fetch_all and is_newest_first(entries)
         for entry in entries:
             pub_date = parse_pub_date(entry)
             if not fetch_all and not is_today(pub_date):
+                # In a newest-first feed nothing after an older entry can be from today
+                if newest_first and pub_date is not None and pub_date < today_start:
+                    break
                 continue
 
             title = getattr(entry, 'title', 'No Title')
             link = getattr(entry, 'link', url)
-            summary = clean_html(getattr(entry, 'summary', ''))[:500]
+            summary = clean_html(getattr(entry, 'summary', ''), is_plain_text(entry))[:500]
 
             articles.append({
                 'category': category,
@@ -126,7 +493,8 @@ def fetch_rss(url: str, category: str, source_name: str, max_items: int = 50, fe
                 'title': title,
                 'link': link,
                 'raw_content': summary,
-                'pub_date': pub_date
+                'pub_date': pub_date,
+                'guid': entry_guid(url, entry)
             })
 
         return articles
@@ -135,22 +503,28 @@ def fetch_rss(url: str, category: str, source_name: str, max_items: int = 50, fe
         return []
 
 
-def fetch_atom(url: str, category: str, source_name: str, max_items: int = 50, fetch_all: bool = False) -> list:
+def fetch_atom(url: str, category: str, source_name: str, max_items: int = 50, fetch_all: bool = False,
+               content: bytes | None = None) -> list:
     """Fetch Atom feeds (like ArXiv API). Returns list of article dicts."""
     try:
-        feed = fetch_feed_content(url)
+        feed = fetch_feed_content(url, content, None if fetch_all else max_items)
         articles = []
 
         entries = feed.entries if fetch_all else feed.entries[:max_items]
+        today_start = today_start_utc()
+        newest_first = not fetch_all and is_newest_first(entries)
         for entry in entries:
             pub_date = parse_pub_date(entry)
             if not fetch_all and not is_today(pub_date):
+                # In a newest-first feed nothing after an older entry can be from today
+                if newest_first and pub_date is not None and pub_date < today_start:
+                    break
                 continue
 
             title = getattr(entry, 'title', 'No Title')
             link = getattr(entry, 'link', '')
             authors = ', '.join([a.get('name', '') for a in getattr(entry, 'authors', [])])
-            summary = clean_html(getattr(entry, 'summary', ''))[:500]
+            summary = clean_html(getattr(entry, 'summary', ''), is_plain_text(entry))[:500]
 
             # Include authors in raw content for context
             raw = f"Authors: {authors}. {summary}" if authors else summary
@@ -161,7 +535,8 @@ def fetch_atom(url: str, category: str, source_name: str, max_items: int = 50, f
                 'title': title,
                 'link': link,
                 'raw_content': raw,
-                'pub_date': pub_date
+                'pub_date': pub_date,
+                'guid': entry_guid(url, entry)
             })
 
         return articles
@@ -170,21 +545,28 @@ def fetch_atom(url: str, category: str, source_name: str, max_items: int = 50, f
         return []
 
 
-def fetch_podcast(url: str, category: str, source_name: str, max_items: int = 50, fetch_all: bool = False) -> list:
+def fetch_podcast(url: str, category: str, source_name: str, max_items: int = 50, fetch_all: bool = False,
+                  content: bytes | None = None) -> list:
     """Fetch podcast RSS feeds. Returns list of episode dicts."""
     try:
-        feed = fetch_feed_content(url)
+        feed = fetch_feed_content(url, content, None if fetch_all else max_items)
         articles = []
 
         entries = feed.entries if fetch_all else feed.entries[:max_items]
+        today_start = today_start_utc()
+        newest_first = not fetch_all and is_newest_first(entries)
         for entry in entries:
             pub_date = parse_pub_date(entry)
             if not fetch_all and not is_today(pub_date):
+                # In a newest-first feed nothing after an older entry can be from today
+                if newest_first and pub_date is not None and pub_date < today_start:
+                    break
                 continue
 
             title = getattr(entry, 'title', 'No Title')
             link = getattr(entry, 'link', '')
-            description = clean_html(getattr(entry, 'summary', getattr(entry, 'description', '')))[:500]
+            description = clean_html(getattr(entry, 'summary', getattr(entry, 'description', '')),
+                                     is_plain_text(entry))[:500]
 
             articles.append({
                 'category': category,
@@ -192,7 +574,8 @@ def fetch_podcast(url: str, category: str, source_name: str, max_items: int = 50
                 'title': title,
                 'link': link,
                 'raw_content': description,
-                'pub_date': pub_date
+                'pub_date': pub_date,
+                'guid': entry_guid(url, entry)
             })
 
         return articles
@@ -201,58 +584,159 @@ def fetch_podcast(url: str, category: str, source_name: str, max_items: int = 50
         return []
 
 
-def fetch_scrape(url: str, category: str, source_name: str) -> list:
-    """Scrape content from a webpage. Returns list with one article dict."""
+def scrape_page(url: str) -> str | None:
+    """Download a webpage and extract its main text, skipping metadata/date detection and fallbacks."""
+    downloaded = trafilatura.fetch_url(url)
+    if not downloaded:
+        return None
+    return trafilatura.extract(
+        downloaded,
+        include_links=False,
+        include_comments=False,
+        include_tables=False,
+        fast=True,
+        favor_precision=True,
+        with_metadata=False,
+        deduplicate=False
+    )
+
+
+def fetch_scrape(url: str, category: str, source_name: str, content: str | None = None) -> list:
+    """Scrape content from a webpage. Returns list with one article dict.
+
+    If content is given (text already extracted by scrape_page), skip the download.
+    """
     try:
-        downloaded = trafilatura.fetch_url(url)
-        if downloaded:
-            text = trafilatura.extract(downloaded, include_links=False)
-            if text:
-                return [{
-                    'category': category,
-                    'source': source_name,
-                    'title': f"{source_name} - Latest",
-                    'link': url,
-                    'raw_content': text[:800],
-                    'pub_date': datetime.now(UTC)  # Assume scraped content is current
-                }]
+        text = content if content is not None else scrape_page(url)
+        if text:
+            return [{
+                'category': category,
+                'source': source_name,
+                'title': f"{source_name} - Latest",
+                'link': url,
+                'raw_content': text[:800],
+                'pub_date': datetime.now(UTC),  # Assume scraped content is current
+                'guid': None  # Page content changes under the same URL, so never cache its summary
+            }]
         return []
     except Exception as e:
         print(f"   Warning: {str(e)}")
         return []
 
 
-def fetch_content(url: str, feed_type: str, category: str, source_name: str, fetch_all: bool = False) -> list:
+def fetch_content(url: str, feed_type: str, category: str, source_name: str, fetch_all: bool = False,
+                  content: bytes | str | None = None) -> list:
     """Route to appropriate fetcher based on feed type."""
     feed_type = (feed_type or 'rss').lower().strip()
 
     if feed_type == 'atom':
-        return fetch_atom(url, category, source_name, fetch_all=fetch_all)
+        return fetch_atom(url, category, source_name, fetch_all=fetch_all, content=content)
     elif feed_type == 'podcast':
-        return fetch_podcast(url, category, source_name, fetch_all=fetch_all)
+        return fetch_podcast(url, category, source_name, fetch_all=fetch_all, content=content)
     elif feed_type == 'scrape':
-        return fetch_scrape(url, category, source_name)
+        return fetch_scrape(url, category, source_name, content=content)
     else:
-        return fetch_rss(url, category, source_name, fetch_all=fetch_all)
+        return fetch_rss(url, category, source_name, fetch_all=fetch_all, content=content)
 
 
-def generate_summaries(articles: list) -> list:
-    """Send articles to Claude for summarization."""
-    if not articles:
+def get_feed_type(row: Feed) -> str:
+    """Read the feed type from a feeds.csv row, defaulting to rss."""
+    return row.type.lower().strip() or 'rss'
+
+
+def parse_feed_bytes(row: Feed, content, fetch_all: bool = False) -> list:
+    """Parse one downloaded feed into article dicts. Top-level so it can run in a worker process."""
+    if content is None:
         return []
-    
-    # Build prompt with all articles
-    articles_text = ""
-    for i, article in enumerate(articles):
-        articles_text += f"""
-ARTICLE {i+1}:
-Title: {article['title']}
-Source: {article['source']}
-Content: {article['raw_content']}
----
-"""
-    
-    prompt = f"""You are a news analyst. For each article below, write a 1-2 sentence summary (max 30 words) capturing the key point.
+    return fetch_content(row.url, get_feed_type(row), row.category, row.source_name,
+                         fetch_all=fetch_all, content=content)
+
+
+async def fetch_one(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, row: Feed,
+                    cache: FeedCache) -> tuple:
+    """Download the raw content for one feed. Returns (row, content), content is None on failure.
+
+    Feeds are requested conditionally; on a 304 the cached response body is returned.
+    """
+    url = row.url
+    async with semaphore:
+        # Scrape targets are downloaded and extracted by trafilatura on a worker thread
+        if get_feed_type(row) == 'scrape':
+            try:
+                return row, await asyncio.to_thread(scrape_page, url)
+            except Exception as e:
+                print(f"   Warning: {row.source_name}: {str(e)}")
+                return row, None
+
+        etag, last_modified, cached_content = cache.get(url)
+        headers = {}
+        if cached_content is not None:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        # Retry once without certificate verification if SSL fails
+        for verify in (True, False):
+            try:
+                async with session.get(url, headers=headers, ssl=verify) as resp:
+                    if resp.status == 304 and cached_content is not None:
+                        return row, cached_content
+                    resp.raise_for_status()
+                    content = await resp.read()
+                    etag = resp.headers.get('ETag')
+                    last_modified = resp.headers.get('Last-Modified')
+                break
+            except aiohttp.ClientConnectorCertificateError:
+                continue
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"   Warning: {row.source_name}: {str(e) or type(e).__name__}")
+                return row, None
+        else:
+            return row, None
+
+    # Feeds with validators are cached so next run can send a conditional request
+    if etag or last_modified:
+        cache.set(url, etag, last_modified, content)
+    return row, content
+
+
+async def fetch_all_feeds(df: pd.DataFrame, cache_path: str, fetch_all: bool = False) -> pd.DataFrame:
+    """Download every feed concurrently, then parse each one. Returns a DataFrame with one row per article."""
+    rows = [Feed._make(values) for values in df[FEED_COLUMNS].itertuples(index=False, name=None)]
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    cache = FeedCache(cache_path)
+    # One pooled session for every feed, so connections to the same host are kept alive
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST, ssl=SSL_CONTEXT)
+    loop = asyncio.get_running_loop()
+    # Parsing is CPU-bound, so it fans out to worker processes
+    with ProcessPoolExecutor() as pool:
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=FETCH_TIMEOUT,
+                                             headers={'User-Agent': feedparser.USER_AGENT}) as session:
+                results = await asyncio.gather(*[fetch_one(session, semaphore, row, cache) for row in rows])
+        finally:
+            cache.close()
+
+        parsed = await asyncio.gather(*[
+            loop.run_in_executor(pool, parse_feed_bytes, row, content, fetch_all)
+            for row, content in results
+        ])
+
+    all_articles = []
+    for (row, _), articles in zip(results, parsed):
+        print(f"Parsed: {row.source_name} ({get_feed_type(row)})...")
+        print(f"   Found {len(articles)} items")
+        all_articles.extend(articles)
+
+    # Columnar layout so sorting, grouping and table output run in pandas
+    articles_df = pd.DataFrame(all_articles, columns=ARTICLE_COLUMNS)
+    articles_df['pub_date'] = pd.to_datetime(articles_df['pub_date'], utc=True)
+    return articles_df
+
+
+# Fixed instructions shared by every batch, marked for Anthropic's prompt cache
+SUMMARY_PREAMBLE = """You are a news analyst. For each article below, write a 1-2 sentence summary (max 30 words) capturing the key point.
 
 Respond ONLY with a numbered list matching the article numbers. No other text.
 
@@ -262,83 +746,130 @@ Format:
 ...
 
 ARTICLES:
-{articles_text}
+"""
+
+
+async def create_message(articles_text: str) -> anthropic.types.Message:
+    """Send a batch of articles to Claude, backing off exponentially on rate limits."""
+    content = [
+        {"type": "text", "text": SUMMARY_PREAMBLE, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": articles_text},
+    ]
+    for attempt in range(SUMMARY_MAX_RETRIES):
+        try:
+            async with summary_semaphore:
+                return await client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=4000,
+                    temperature=0,
+                    messages=[{"role": "user", "content": content}]
+                )
+        except anthropic.RateLimitError:
+            if attempt == SUMMARY_MAX_RETRIES - 1:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+
+async def agenerate_summaries(articles: pd.DataFrame) -> list:
+    """Send articles to Claude for summarization. Returns one summary per row."""
+    if articles.empty:
+        return []
+    
+    # Build prompt with all articles
+    articles_text = ""
+    for i, article in enumerate(articles.itertuples(index=False)):
+        articles_text += f"""
+ARTICLE {i+1}:
+Title: {article.title}
+Source: {article.source}
+Content: {article.raw_content}
+---
 """
     
     try:
-        message = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=4000,
-            temperature=0,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        message = await create_message(articles_text)
         
         response_text = message.content[0].text
         
-        # Parse numbered summaries
-        summaries = {}
-        for line in response_text.strip().split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            # Match "1. summary" or "1) summary" or just "1 summary"
-            match = re.match(r'^(\d+)[\.\)\s]+(.+)$', line)
-            if match:
-                num = int(match.group(1))
-                summary = match.group(2).strip()
-                summaries[num] = summary
+        # Parse numbered summaries in a single pass over the response
+        summaries = {int(m.group(1)): m.group(2) for m in SUMMARY_LINE_RE.finditer(response_text)}
         
-        # Assign summaries to articles
-        for i, article in enumerate(articles):
-            article['summary'] = summaries.get(i + 1, "Summary unavailable")
-        
-        return articles
+        # Match summaries to articles
+        return [summaries.get(i + 1, SUMMARY_UNAVAILABLE) for i in range(len(articles))]
         
     except anthropic.APIError as e:
         print(f"Claude API Error: {e}")
-        for article in articles:
-            article['summary'] = "Error generating summary"
-        return articles
+        return [SUMMARY_ERROR] * len(articles)
 
 
-def escape_markdown(text: str) -> str:
+async def generate_all_summaries(articles: pd.DataFrame, cache_path: str, batch_size: int = 50) -> pd.DataFrame:
+    """Summarize articles in batches, sending all batches to Claude concurrently.
+
+    Summaries already in the summary cache are reused; only the rest are sent to Claude.
+    """
+    cache = SummaryCache(cache_path)
+    try:
+        known_guids = articles['guid'].dropna().unique().tolist()
+        articles['summary'] = articles['guid'].map(cache.get_many(known_guids)).astype(object)
+        uncached = articles[articles['summary'].isna()]
+        num_batches = (len(uncached) + batch_size - 1) // batch_size
+        print(f"   {len(articles) - len(uncached)} summaries loaded from cache")
+        print(f"   Processing {len(uncached)} articles in {num_batches} batches...")
+
+        tasks = [agenerate_summaries(uncached.iloc[i:i + batch_size]) for i in range(0, len(uncached), batch_size)]
+        results = await asyncio.gather(*tasks)
+        articles.loc[uncached.index, 'summary'] = [summary for batch in results for summary in batch]
+
+        # Only cache real summaries for articles with a stable GUID
+        fresh = articles.loc[uncached.index]
+        fresh = fresh[fresh['guid'].notna() & ~fresh['summary'].isin([SUMMARY_UNAVAILABLE, SUMMARY_ERROR])]
+        cache.set_many(list(zip(fresh['guid'], fresh['summary'])))
+    finally:
+        cache.close()
+    return articles
+
+
+def escape_markdown(text: pd.Series) -> pd.Series:
     """Escape pipe characters for Markdown tables."""
-    return text.replace('|', '\\|')
+    return text.str.replace('|', '\\|', regex=False)
 
 
-def group_articles_by_date(articles: list) -> dict:
-    """Group articles by their publication date (YYYY-MM-DD)."""
-    grouped = defaultdict(list)
-    for article in articles:
-        pub_date = article.get('pub_date')
-        if pub_date:
-            date_key = pub_date.astimezone(UTC).date().strftime("%Y-%m-%d")
-        else:
-            date_key = "unknown"
-        grouped[date_key].append(article)
-    return grouped
+def sort_articles(articles: pd.DataFrame) -> pd.DataFrame:
+    """Sort articles by publication date in place (newest first, undated last)."""
+    articles.sort_values('pub_date', ascending=False, na_position='last', kind='stable', inplace=True)
+    return articles
+
+
+def group_articles_by_date(articles: pd.DataFrame):
+    """Group sorted articles by their publication date (YYYY-MM-DD), newest date first.
 
+    Groups keep the newest-first row order, so they need no further sorting.
+    """
+    articles['date_key'] = articles['pub_date'].dt.strftime("%Y-%m-%d").fillna("unknown")
+    return articles.groupby('date_key', sort=False)
 
-def write_briefing(articles: list, date_str: str, output_dir: str) -> str:
-    """Write a daily briefing markdown file for a specific date."""
-    # Sort by publication date (newest first)
-    articles.sort(key=lambda x: (x.get('pub_date') or datetime.min.replace(tzinfo=UTC)), reverse=True)
 
+def write_briefing(articles: pd.DataFrame, date_str: str, output_dir: str) -> str:
+    """Write a daily briefing markdown file for a specific date. Articles must already be sorted."""
     # Create table
     table_lines = [
         "| Date/Time | Category | Source | Title | Summary | Link |",
         "|-----------|----------|--------|-------|---------|------|"
     ]
 
-    for article in articles:
-        pub_date_str = format_pub_date(article.get('pub_date'))
-        category = escape_markdown(article['category'])
-        source = escape_markdown(article['source'])
-        title = escape_markdown(article['title'][:60] + '...' if len(article['title']) > 60 else article['title'])
-        summary = escape_markdown(article.get('summary', 'N/A'))
-        link = article['link']
-
-        table_lines.append(f"| {pub_date_str} | {category} | {source} | {title} | {summary} | [Link]({link}) |")
+    # Build every row at once from whole columns
+    titles = articles['title']
+    title = titles.where(titles.str.len() <= 60, titles.str.slice(0, 60) + '...')
+    summary = articles['summary'] if 'summary' in articles else pd.Series('N/A', index=articles.index)
+    rows = (
+        "| " + format_pub_dates(articles['pub_date'])
+        + " | " + escape_markdown(articles['category'])
+        + " | " + escape_markdown(articles['source'])
+        + " | " + escape_markdown(title)
+        + " | " + escape_markdown(summary)
+        + " | [Link](" + articles['link'] + ") |"
+    )
+    table_lines.extend(rows)
 
     os.makedirs(output_dir, exist_ok=True)
     filename = os.path.join(output_dir, f"{date_str}.md")
@@ -354,7 +885,21 @@ def write_briefing(articles: list, date_str: str, output_dir: str) -> str:
     return filename
 
 
+async def write_all_briefings(dated_groups: list, output_dir: str) -> list:
+    """Write one briefing per (date_str, articles) group concurrently on worker threads.
+
+    Returns the filenames in the same order as the groups.
+    """
+    return await asyncio.gather(*[
+        asyncio.to_thread(write_briefing, articles, date_str, output_dir)
+        for date_str, articles in dated_groups
+    ])
+
+
 def main():
+    global TODAY_UTC
+    TODAY_UTC = datetime.now(UTC).date()
+
     parser = argparse.ArgumentParser(description="Low-Bandwidth News Aggregator")
     parser.add_argument('--fetch-all', action='store_true',
                         help='Fetch all available articles (not just today) and create separate briefings by date')
@@ -378,31 +923,18 @@ def main():
         return
 
     # Read feeds
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, usecols=FEED_COLUMNS, dtype=str, na_filter=False, engine='c')
     print(f"Loaded {len(df)} feed sources\n")
 
-    # Fetch all articles
-    all_articles = []
-
-    for index, row in df.iterrows():
-        source_name = row['Source Name']
-        category = row['Category']
-        url = row['URL']
-        feed_type = row.get('Type', 'rss')
-
-        if pd.isna(feed_type) or feed_type == '':
-            feed_type = 'rss'
-
-        print(f"Fetching: {source_name} ({feed_type})...")
-
-        articles = fetch_content(url, feed_type, category, source_name, fetch_all=fetch_all)
-        print(f"   Found {len(articles)} items")
-        all_articles.extend(articles)
+    # Fetch all articles (downloads run concurrently)
+    print(f"Fetching {len(df)} feeds...")
+    cache_path = os.path.join(base_dir, 'data', 'feed_cache.sqlite')
+    all_articles = asyncio.run(fetch_all_feeds(df, cache_path, fetch_all=fetch_all))
 
     print(f"\nTotal articles fetched: {len(all_articles)}")
     print("-" * 50)
 
-    if not all_articles:
+    if all_articles.empty:
         print("No articles found. Check your feed URLs.")
         return
 
@@ -410,12 +942,13 @@ def main():
     print("Generating summaries with Claude...")
     print("   (This may take a moment...)")
 
-    # Process in batches of 20 to avoid token limits
-    batch_size = 20
-    for i in range(0, len(all_articles), batch_size):
-        batch = all_articles[i:i + batch_size]
-        print(f"   Processing articles {i+1}-{min(i+batch_size, len(all_articles))}...")
-        generate_summaries(batch)
+    # Process in batches of 50 to stay within output token limits
+    batch_size = 50
+    summary_cache_path = os.path.join(base_dir, 'data', 'summary_cache.sqlite')
+    asyncio.run(generate_all_summaries(all_articles, summary_cache_path, batch_size))
+
+    # Sort once (newest first); grouping and every briefing reuse this order
+    sort_articles(all_articles)
 
     # Output directory
     briefings_dir = os.path.join(base_dir, "Daily Briefings")
@@ -424,28 +957,27 @@ def main():
         # Group by date and write separate files
         print("\nGrouping articles by date...")
         grouped = group_articles_by_date(all_articles)
-
-        # Sort dates (newest first)
-        sorted_dates = sorted(grouped.keys(), reverse=True)
-        print(f"Found articles across {len(sorted_dates)} different dates")
+        print(f"Found articles across {grouped.ngroups} different dates")
 
         print("\nWriting briefings...")
-        for date_str in sorted_dates:
-            articles = grouped[date_str]
+        dated_groups = []
+        for date_str, articles in grouped:
             if date_str == "unknown":
                 print(f"   Skipping {len(articles)} articles with unknown dates")
                 continue
-            filename = write_briefing(articles, date_str, briefings_dir)
+            dated_groups.append((date_str, articles))
+
+        filenames = asyncio.run(write_all_briefings(dated_groups, briefings_dir))
+        for (date_str, articles), filename in zip(dated_groups, filenames):
             print(f"   {date_str}: {len(articles)} articles -> {filename}")
 
-        print(f"\nSuccess! Created {len(sorted_dates)} daily briefings")
+        print(f"\nSuccess! Created {grouped.ngroups} daily briefings")
         print(f"Total: {len(all_articles)} articles summarized.")
     else:
         # Original behavior: single file for today
         print("\nBuilding Markdown table...")
 
-        today_date = datetime.now(UTC).date()
-        today = today_date.strftime("%Y-%m-%d")
+        today = TODAY_UTC.strftime("%Y-%m-%d")
 
         filename = write_briefing(all_articles, today, briefings_dir)
 